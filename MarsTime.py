@@ -1,19 +1,20 @@
-from datetime import datetime, timezone
+from datetime import datetime
+from functools import lru_cache
 import math
-import curses
+import os
+import sys
+import time
+
+import numpy as np
 
 
 # ----------------------------
 # 1) UTC → JD(UT) conversion
 # ----------------------------
-def _jd_ut_from_utc(dt):
-    """
-    UTC tz-aware datetime → Julian Date(UT)
-    - The JD for 1970-01-01 00:00:00 UTC (Unix epoch) is 2440587.5
-    - dt.timestamp(): seconds after epoch
-    - 1 day = 86400 seconds
-    """
-    return 2440587.5 + dt.timestamp() / 86400.0
+# JD(UT) = 2440587.5 + epoch seconds / 86400
+# - The JD for 1970-01-01 00:00:00 UTC (Unix epoch) is 2440587.5
+# - 1 day = 86400 seconds
+_JD_UNIX_EPOCH = 2440587.5
 
 
 # ----------------------------
@@ -28,17 +29,26 @@ def _tt_minus_utc_seconds():
     return 69.184
 
 
-def _jd_tt_from_utc(dt):
+# JD(TT) at the Unix epoch, folded once so the per-call path is a single multiply-add
+_JD_TT_UNIX_EPOCH = _JD_UNIX_EPOCH + _tt_minus_utc_seconds() / 86400.0
+
+
+def _jd_tt_from_epoch(epoch_s):
     """
-    JD(TT) = JD(UT) + (TT-UTC)/86400
+    Unix epoch seconds → JD(TT) = JD(UT) + (TT-UTC)/86400
+    - Accepts a scalar or a NumPy array of epoch seconds.
     """
-    # NOTE: The dt argument in _tt_minus_utc_seconds is currently ignored but kept for potential future use.
-    return _jd_ut_from_utc(dt) + _tt_minus_utc_seconds() / 86400.0
+    return _JD_TT_UNIX_EPOCH + epoch_s / 86400.0
 
 
 # ----------------------------
 # 3) math helper
 # ----------------------------
+# Degree/radian conversion factors, multiplied inline instead of math.radians/degrees
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+
+
 def _mod24(h):
     """Wraps the time value to the 0-24 range (handles negative/excess values)."""
     return h % 24.0
@@ -57,12 +67,18 @@ def _days_since_j2000_tt(jd_tt):
 # ----------------------------
 def _mars_mean_anomaly(dtj):
     """B-1: Mars Mean Anomaly M (radians)"""
-    return math.radians(19.3871 + 0.52402073 * dtj)
+    return (19.3871 + 0.52402073 * dtj) * _DEG2RAD
 
 
 def _fiction_mean_sun(dtj):
     """B-2: Fictitious Mean Sun (αFMS) (radians)"""
-    return math.radians(270.3871 + 0.524038496 * dtj)
+    return (270.3871 + 0.524038496 * dtj) * _DEG2RAD
+
+
+# B-3 constants: amplitude A (deg), period tau (Julian years), phase phi (deg)
+_PBS_A = (0.0071, 0.0057, 0.0039, 0.0037, 0.0021, 0.0020, 0.0018)
+_PBS_TAU = (2.2353, 2.7543, 1.1177, 15.7866, 2.1354, 2.4694, 32.8493)
+_PBS_PHI = (49.409, 168.173, 191.837, 21.736, 15.704, 95.528, 49.095)
 
 
 def _pbs_term(dtj):
@@ -70,12 +86,9 @@ def _pbs_term(dtj):
     B-3: Perturbers Correction Term PBS (degrees)
     - The sum of small periodic terms due to perturbations from other planets.
     """
-    A = [0.0071, 0.0057, 0.0039, 0.0037, 0.0021, 0.0020, 0.0018]
-    tau = [2.2353, 2.7543, 1.1177, 15.7866, 2.1354, 2.4694, 32.8493]
-    phi = [49.409, 168.173, 191.837, 21.736, 15.704, 95.528, 49.095]
     s = 0.0
-    for Ai, ti, ph in zip(A, tau, phi):
-        s += Ai * math.cos(math.radians((0.985626 * dtj) / ti + ph))
+    for Ai, ti, ph in zip(_PBS_A, _PBS_TAU, _PBS_PHI):
+        s += Ai * math.cos(((0.985626 * dtj) / ti + ph) * _DEG2RAD)
     return s
 
 
@@ -93,7 +106,7 @@ def _equation_of_center(M, dtj, pbs_deg):
 
 def _areocentric_solar_longitude(alpha_fms_rad, eq_center_deg):
     """B-5: Mars Seasonal Angle Ls (degrees)"""
-    return math.degrees(alpha_fms_rad) + eq_center_deg
+    return alpha_fms_rad * _RAD2DEG + eq_center_deg
 
 
 # ----------------------------
@@ -104,7 +117,7 @@ def _equation_of_time_h(Ls_deg, eq_center_deg):
     C-1: EOT (hours)
     - The difference between Mean Solar Time and True Solar Time (Mars time zone correction)
     """
-    Ls = math.radians(Ls_deg)
+    Ls = Ls_deg * _DEG2RAD
     eot_deg = (
         2.861 * math.sin(2 * Ls)
         - 0.071 * math.sin(4 * Ls)
@@ -118,13 +131,72 @@ def _mst_hours_from_jdtt(jd_tt):
     """
     C-2: MST (a.k.a MTC) in hours
     - Mean Solar Time based on the 0° longitude (Airy-0 meridian).
+    - Accepts a scalar or a NumPy array.
     """
     return _mod24(24.0 * (((jd_tt - 2451549.5) / 1.0274912517) + 44796.0 - 0.0009626))
 
 
+def _eot_hours(dtj):
+    """B-1 to C-1: EOT (hours) from days since J2000(TT)."""
+    M = _mars_mean_anomaly(dtj)
+    aF = _fiction_mean_sun(dtj)
+    pbs = _pbs_term(dtj)
+    ec = _equation_of_center(M, dtj, pbs)
+    Ls = _areocentric_solar_longitude(aF, ec)
+    return _equation_of_time_h(Ls, ec)
+
+
+if os.environ.get("MARS_TIME_NUMBA") == "1":
+    # Opt-in: compile the helpers above with Numba. The EOT is only evaluated once per
+    # second (see _mars_state_for_epoch_second), so this is off by default to keep
+    # imports fast.
+    from numba import njit
+
+    _njit = njit(cache=True, fastmath=True)
+    _mars_mean_anomaly = _njit(_mars_mean_anomaly)
+    _fiction_mean_sun = _njit(_fiction_mean_sun)
+    _pbs_term = _njit(_pbs_term)
+    _equation_of_center = _njit(_equation_of_center)
+    _areocentric_solar_longitude = _njit(_areocentric_solar_longitude)
+    _equation_of_time_h = _njit(_equation_of_time_h)
+    _eot_hours = _njit(_eot_hours)
+    # Cold call so the compile (or cache load) happens at import, not on first use
+    _eot_hours(0.0)
+
+
 # ----------------------------
 # 6) Final: LTST Calculation Function
 # ----------------------------
+# MST advance per Earth second (hours): 24 Mars hours per 1.0274912517 Earth days
+_MST_H_PER_SECOND = 24.0 / (1.0274912517 * 86400.0)
+
+
+@lru_cache(maxsize=4096)
+def _mars_state_for_epoch_second(epoch_s: int):
+    """
+    Site-independent part of the LTST calculation at a whole UTC second.
+    - Returns (MST hours at Airy-0, EOT hours); only longitude differs between sites.
+    - Cached: concurrent API requests hit the same second repeatedly.
+    """
+    jd_tt = _jd_tt_from_epoch(epoch_s)
+    dtj = _days_since_j2000_tt(jd_tt)
+    eot_h = _eot_hours(dtj)
+    mst_h = _mst_hours_from_jdtt(jd_tt)
+    return mst_h, eot_h
+
+
+def _mars_state(utc_dt):
+    """
+    (MST hours, EOT hours) for a tz-aware UTC datetime.
+    - The cached state is looked up by whole second; the sub-second remainder only
+      advances MST. EOT is held at the whole second, which keeps LTST within 1 ms.
+    """
+    ts = utc_dt.timestamp()
+    epoch_s = math.floor(ts)
+    mst_h, eot_h = _mars_state_for_epoch_second(epoch_s)
+    return mst_h + (ts - epoch_s) * _MST_H_PER_SECOND, eot_h
+
+
 def ltst_from_utc_lon(utc_dt: datetime, lon_east_deg: float) -> float:
     """
     Inputs:
@@ -133,15 +205,7 @@ def ltst_from_utc_lon(utc_dt: datetime, lon_east_deg: float) -> float:
     Output:
       - LTST (Local True Solar Time in hours, float in 0-24 range)
     """
-    jd_tt = _jd_tt_from_utc(utc_dt)
-    dtj = _days_since_j2000_tt(jd_tt)
-    M = _mars_mean_anomaly(dtj)
-    aF = _fiction_mean_sun(dtj)
-    pbs = _pbs_term(dtj)
-    ec = _equation_of_center(M, dtj, pbs)
-    Ls = _areocentric_solar_longitude(aF, ec)
-    eot_h = _equation_of_time_h(Ls, ec)
-    mst_h = _mst_hours_from_jdtt(jd_tt)
+    mst_h, eot_h = _mars_state(utc_dt)
     # Local Mean Solar Time (LMST) = MST + Longitude / 15 (since 360 deg / 24 hrs = 15 deg/hr)
     lmst_h = _mod24(mst_h + lon_east_deg / 15.0)
     # Local True Solar Time (LTST) = LMST + EOT
@@ -149,6 +213,31 @@ def ltst_from_utc_lon(utc_dt: datetime, lon_east_deg: float) -> float:
     return ltst_h
 
 
+def ltst_from_utc_lon_array(utc_dt: datetime, lons_np: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ltst_from_utc_lon over many longitudes at the same instant.
+    - The astronomical terms are computed once and broadcast over lons_np.
+    """
+    mst_h, eot_h = _mars_state(utc_dt)
+    lmst_h = _mod24(mst_h + lons_np / 15.0)
+    return _mod24(lmst_h + eot_h)
+
+
+def ltst_table(epoch0: int, lon_h: np.ndarray, n: int = 60) -> np.ndarray:
+    """
+    LTST for the n whole seconds starting at epoch0, for every longitude (in hours).
+    - Returns an (n, len(lon_h)) array; row i is the LTST at epoch0 + i.
+    - EOT (B-1..C-1) uses the scalar helpers per row; n calls once per table refill.
+    """
+    epoch_s = epoch0 + np.arange(n, dtype=float)
+    jd_tt = _jd_tt_from_epoch(epoch_s)
+    dtj = _days_since_j2000_tt(jd_tt)
+    eot_h = np.array([_eot_hours(d) for d in dtj])
+    mst_h = _mst_hours_from_jdtt(jd_tt)
+    lmst_h = _mod24(mst_h[:, None] + lon_h)
+    return _mod24(lmst_h + eot_h[:, None])
+
+
 # ----------------------------
 # 7) local locations(5)
 # ----------------------------
@@ -159,6 +248,8 @@ SITES = [
     ("Elysium Planitia", 135.9),
     ("Olympus Mons", 226.2),
 ]
+# East longitudes of SITES in hours (degrees / 15), in the same order, for ltst_table
+SITE_LON_H = np.array([lon for _, lon in SITES]) / 15.0
 
 
 # ----------------------------
@@ -166,61 +257,104 @@ SITES = [
 # ----------------------------
 def _hhmmss(h: float) -> str:
     """Formats a float hour value (0-24) into HH:MM:SS string."""
-    h = h % 24.0
-    hh = int(h)
-    mmf = (h - hh) * 60
-    mm = int(mmf)
-    ss = int(round((mmf - mm) * 60))
-    if ss == 60:
-        ss = 0
-        mm += 1
-    if mm == 60:
-        mm = 0
-        hh = (hh + 1) % 24
+    return _hhmmss_int(int(round(h * 3600.0)) % 86400)
+
+
+@lru_cache(maxsize=256)
+def _hhmmss_int(total_s: int) -> str:
+    """Formats whole seconds of day (0-86399) as HH:MM:SS."""
+    hh, rem = divmod(total_s, 3600)
+    mm, ss = divmod(rem, 60)
     return f"{hh:02d}:{mm:02d}:{ss:02d}"
 
 
 # ----------------------------
-# 9) real time (curses used)
+# 9) real time (ANSI escape codes)
 # ----------------------------
-def draw(stdscr):
-    # Hide cursor
-    curses.curs_set(0)
-    # Non-blocking input mode
-    stdscr.nodelay(True)
-    # Set screen refresh timeout to 1000ms (1 second)
-    stdscr.timeout(1000)
-
-    while True:
-        ch = stdscr.getch()
-        if ch in (ord("q"), ord("Q")):
-            break
-
-        utc_now = datetime.now(timezone.utc)
-        # Clear screen
-        stdscr.erase()
-
+# Seconds of LTST precomputed per ltst_table call in draw()
+TABLE_SECONDS = 60
+# Width of the site-name column; the LTST column starts one space after it
+NAME_WIDTH = 20
+
+
+def _write_at(row, col, text):
+    """Moves the cursor to (row, col) (0-based), clears to end of line, writes text."""
+    sys.stdout.write(f"\x1b[{row + 1};{col + 1}H\x1b[K{text}")
+
+
+def draw():
+    # POSIX terminal modules are only needed here, not by importers such as app.py
+    import select
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    # Unbuffered key input so 'q' is seen without Enter
+    tty.setcbreak(fd)
+    # Alternate screen, hide cursor, clear
+    sys.stdout.write("\x1b[?1049h\x1b[?25l\x1b[2J")
+    try:
+        # Static layout is drawn once; the loop only rewrites the UTC line and LTST
+        # cells
         y = 0
-        stdscr.addstr(y, 0, "==== Real-time Mars Local True Solar Time (LTST) ====")
+        _write_at(y, 0, "==== Real-time Mars Local True Solar Time (LTST) ====")
         y += 1
-        stdscr.addstr(y, 0, f"UTC Time: {utc_now:%Y-%m-%d %H:%M:%S}")
+        utc_row = y
         y += 2
-        stdscr.addstr(y, 0, f"{'Site':20s} {'LTST':>8s}")
+        _write_at(y, 0, f"{'Site':{NAME_WIDTH}s} {'LTST':>8s}")
         y += 1
-        stdscr.addstr(y, 0, "-" * 32)
+        _write_at(y, 0, "-" * 32)
         y += 1
 
-        for name, lon in SITES:
-            h = ltst_from_utc_lon(utc_now, lon)
-            stdscr.addstr(y, 0, f"{name:20s} {_hhmmss(h):>8s}")
+        site_rows = []
+        for name, _ in SITES:
+            _write_at(y, 0, f"{name:{NAME_WIDTH}s}")
+            site_rows.append(y)
             y += 1
-
-        stdscr.addstr(y + 1, 0, "⏳ Updating every second... (press 'q' to quit)")
-        stdscr.refresh()
+        ltst_col = NAME_WIDTH + 1
+
+        _write_at(y + 1, 0, "⏳ Updating every second... (press 'q' to quit)")
+        sys.stdout.flush()
+
+        # LTST for the next TABLE_SECONDS whole seconds, refilled when the clock runs
+        # past it
+        table_epoch = None
+        table = None
+        # Draw the first frame immediately; later waits are set per frame below
+        wait_s = 0.0
+
+        while True:
+            ready, _, _ = select.select([fd], [], [], wait_s)
+            if ready and os.read(fd, 1) in (b"q", b"Q"):
+                break
+
+            epoch_now = time.time()
+
+            utc_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(epoch_now))
+            _write_at(utc_row, 0, f"UTC Time: {utc_str}")
+
+            second = int(epoch_now)
+            if table_epoch is None or not 0 <= second - table_epoch < TABLE_SECONDS:
+                table_epoch = second
+                table = ltst_table(table_epoch, SITE_LON_H, TABLE_SECONDS)
+            ltsts = table[second - table_epoch]
+            for row, h in zip(site_rows, ltsts):
+                _write_at(row, ltst_col, f"{_hhmmss(h):>8s}")
+
+            sys.stdout.flush()
+            # Wake on the next whole UTC second instead of a fixed 1s, so the clock
+            # doesn't drift
+            wait_s = max(0.001, 1.0 - epoch_now % 1.0)
+    finally:
+        # Show cursor, leave the alternate screen and restore the terminal mode
+        sys.stdout.write("\x1b[?25h\x1b[?1049l")
+        sys.stdout.flush()
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
 
 
 def main():
-    curses.wrapper(draw)
+    draw()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,50 @@
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+from MarsTime import ltst_from_utc_lon, ltst_from_utc_lon_array, _hhmmss
+
+try:
+    # Faster JSON encoding for jsonify; Flask's default provider is used without it
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson.
+    - Request parsing (loads) stays on Flask's default provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # Datetimes go through self.default so they keep Flask's HTTP-date format
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        default = kwargs.get("default", self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
 
-from MarsTime import ltst_from_utc_lon, _hhmmss
 
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+
+@lru_cache(maxsize=128)
+def _parse_iso(s: str) -> datetime:
+    """
+    Cached datetime.fromisoformat.
+    - Only hits when the exact same string is sent again (retries, or several clients
+      sharing a whole-second timestamp). home.html sends millisecond-precision
+      times, which never repeat, so the cache is kept small.
+    """
+    return datetime.fromisoformat(s)
 
 
 @app.route("/")
@@ -15,11 +55,23 @@ def homepage():
 @app.route("/api/mars_time", methods=["POST"])
 def get_mars_time_for_station():
     data = request.get_json()
-    earth_time: datetime = datetime.fromisoformat(data["earth_time"])
+    earth_time: datetime = _parse_iso(data["earth_time"])
+    if "lons" in data:
+        # Batch form: {"earth_time": ..., "lons": [...]} -> {"ltst": ["HH:MM:SS", ...]}
+        lons = data["lons"]
+        if not isinstance(lons, list) or not all(
+            isinstance(lon, (int, float)) and not isinstance(lon, bool) for lon in lons
+        ):
+            return jsonify(error="lons must be a flat list of numbers"), 400
+        longitudes = np.asarray(lons, dtype=float)
+        mars_times = ltst_from_utc_lon_array(earth_time, longitudes)
+        return jsonify(ltst=[_hhmmss(h) for h in mars_times])
     longitude: float = float(data["lon"])
     mars_time: float = ltst_from_utc_lon(earth_time, longitude)
     return jsonify(ltst=_hhmmss(mars_time))
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=8080)
+    # Development server only; in production serve the `app` WSGI callable with
+    # gunicorn (see README)
+    app.run(port=8080)